@@ -36,7 +36,6 @@ from shapely.ops import split
 
 from boxes import edges, formats, gears, parts, pulley
 from boxes.Color import *
-from boxes.qrcode_factory import BoxesQrCodeFactory
 from boxes.vectors import kerf
 
 ### Helpers
@@ -1565,7 +1564,7 @@ class Boxes:
         self.ctx.restore()
 
     def qrcode(self, content, box_size=1.0, color=Color.ETCHING, move=None):
-        q = qrcode.QRCode(image_factory=BoxesQrCodeFactory, box_size=box_size*10)
+        q = qrcode.QRCode()
         q.add_data(content)
         m = q.get_matrix()
         tw, th = len(m) * box_size, len(m[0]) * box_size
@@ -1573,7 +1572,14 @@ class Boxes:
             return
 
         self.set_source_color(color)
-        q.make_image(ctx=self.ctx)
+        # Draw from the matrix directly instead of going through
+        # make_image(), which would re-walk all modules a second time
+        # via the image factory's drawrect().
+        for row, line in enumerate(m):
+            x = row * box_size
+            for col, val in enumerate(line):
+                if val:
+                    self.ctx.rectangle(x, col * box_size, box_size, box_size)
 
         self.move(tw, th, move)
 
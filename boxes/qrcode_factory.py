@@ -1,5 +1,3 @@
-from decimal import Decimal
-
 import qrcode.image.base
 import qrcode.image.svg
 
@@ -17,41 +15,44 @@ class BoxesQrCodeFactory(qrcode.image.base.BaseImage):
         super().__init__(*args, **kwargs)
         self.ctx = ctx
         self.x, self.y = x, y
+        # A box_size of 10 equals 1mm per module.
+        self.size = self.box_size / 10
         # Save the unit size, for example the default box_size of 10 is '1mm'.
         self.unit_size = self.units(self.box_size)
 
     def drawrect(self, row, col):
-        self.ctx.rectangle(*self._rect(row, col))
-        self._img.append(self._rect(row, col))
+        x, y, w, h = self._rect(row, col)
+        self.ctx.rectangle(x, y, w, h)
+        self._img.append(f'<rect x="{x}" y="{y}" width="{w}" height="{h}" />')
 
     def units(self, pixels, text=True):
         """
         A box_size of 10 (default) equals 1mm.
         """
-        units = Decimal(pixels) / 10
+        units = pixels / 10
         if not text:
             return units
-        return '%smm' % units
+        return f'{units}mm'
 
     def save(self, stream, kind=None):
         self.check_kind(kind=kind)
         self._write(stream)
 
     def to_string(self):
-        return f"".join(self._img)
+        return "".join(self._img)
 
     def new_image(self, **kwargs):
         self._img = []
         return self._img
 
     def _rect(self, row, col):
-        size = self.box_size / 10
+        size = self.size
         x = self.x + (row + self.border) * size
         y = self.y + (col + self.border) * size
         return x, y, size, size
 
     def _write(self, stream):
-        stream.write("".join(self._img))
+        stream.writelines(self._img)
 
 if __name__=="__main__":
     import qrcode